@@ -0,0 +1,163 @@
+"""Example of running the GHZ benchmark on cloud-hosted QPUs.
+
+IBM circuits are submitted together under a single Qiskit Runtime ``Batch``
+so their classical compilation runs in parallel and the inter-job gap is
+minimized; AWS circuits are submitted together via Braket's ``run_batch``
+so SV1 runs the tasks in parallel. All jobs are submitted up front and then
+polled concurrently, so the queue waits overlap instead of being paid
+back-to-back. Polling uses an adaptive backoff: short sleeps at first so
+quick jobs return promptly, growing geometrically so long queue waits
+don't hammer the provider API.
+
+Running this example requires IBM Quantum credentials (qiskit-ibm-runtime)
+and AWS Braket credentials (amazon-braket-sdk).
+"""
+
+import asyncio
+import collections
+import time
+from typing import Callable, FrozenSet, List, Optional
+
+import qiskit
+from braket.aws import AwsDevice, AwsSession
+from braket.circuits import Circuit
+from qiskit_ibm_runtime import Batch, QiskitRuntimeService, SamplerV2
+
+import supermarq
+from supermarq.features import cirq_to_qiskit
+
+# IBM recommends keeping batches to a modest number of jobs apiece
+MAX_CIRCUITS_PER_BATCH = 10
+
+SV1_ARN = "arn:aws:braket:::device/quantum-simulator/amazon/sv1"
+
+
+async def wait_done(
+    get_status: Callable[[], str],
+    done_states: FrozenSet[str],
+    failed_states: FrozenSet[str],
+    cancel: Optional[Callable[[], None]] = None,
+    timeout: float = 600.0,
+    initial: float = 0.5,
+    cap: float = 10.0,
+) -> None:
+    """Poll `get_status` until a terminal state, backing off between polls.
+
+    The delay starts at `initial` seconds and grows by 1.5x per poll up to
+    `cap` seconds. Using `asyncio.sleep` frees the event loop so other jobs
+    can be polled (or other work done) while this one sits in the queue.
+
+    Raises RuntimeError if the job lands in one of `failed_states`, and
+    TimeoutError after `timeout` seconds — cancelling the job first via
+    `cancel` if provided — so a stuck job can't keep the process (and the
+    billing meter) running forever.
+    """
+    start = time.monotonic()
+    delay = initial
+    while True:
+        status = get_status()
+        if status in done_states:
+            return
+        if status in failed_states:
+            raise RuntimeError(f"job ended in status {status!r}")
+        if time.monotonic() - start > timeout:
+            if cancel is not None:
+                cancel()
+            raise TimeoutError(f"job did not complete within {timeout}s")
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, cap)
+
+
+def run_ghz_batch(
+    service: QiskitRuntimeService,
+    backend: str,
+    circuits: List[qiskit.circuit.QuantumCircuit],
+    shots: int,
+) -> List:
+    """Submit `circuits` to an IBM backend under Runtime Batch sessions.
+
+    Grouping submissions in a ``Batch`` lets the service compile the jobs in
+    parallel and schedule them back-to-back, instead of paying the full
+    compile + queue-entry latency once per circuit.
+    """
+    jobs = []
+    for start in range(0, len(circuits), MAX_CIRCUITS_PER_BATCH):
+        chunk = circuits[start : start + MAX_CIRCUITS_PER_BATCH]
+        with Batch(service=service, backend=backend):
+            sampler = SamplerV2()
+            jobs.extend(sampler.run([circ], shots=shots) for circ in chunk)
+    return jobs
+
+
+def ghz_braket_circuit(n: int) -> Circuit:
+    """Build the n-qubit GHZ circuit natively in Braket."""
+    circuit = Circuit().h(0)
+    for i in range(n - 1):
+        circuit.cnot(i, i + 1)
+    return circuit
+
+
+async def main() -> None:
+    # Build every GHZ benchmark (and its circuit) exactly once up front
+    benchmarks = [supermarq.ghz.GHZ(n) for n in range(3, 7)]
+    circuits = [ghz.circuit() for ghz in benchmarks]
+    print(circuits[0])
+
+    # One authenticated session per provider, shared by every submission and
+    # poll below, so the underlying HTTP connections (and their TLS
+    # handshakes) are reused instead of re-established per request
+    ibm_service = QiskitRuntimeService()
+    aws_session = AwsSession()
+
+    qiskit_circuits = [cirq_to_qiskit(circ) for circ in circuits]
+    ibm_jobs = run_ghz_batch(
+        ibm_service,
+        backend="ibmq_qasm_simulator",
+        circuits=qiskit_circuits,
+        shots=1000,
+    )
+
+    # Submit all of the AWS tasks in one batch so SV1 executes them in parallel
+    device = AwsDevice(SV1_ARN, aws_session=aws_session)
+    aws_batch = device.run_batch(
+        [ghz_braket_circuit(ghz.n) for ghz in benchmarks], shots=1000
+    )
+
+    # Poll the IBM jobs and AWS task handles concurrently so queue times overlap
+    ibm_tasks = [
+        asyncio.create_task(
+            wait_done(
+                job.status,
+                done_states=frozenset({"DONE"}),
+                failed_states=frozenset({"ERROR", "CANCELLED"}),
+                cancel=job.cancel,
+            )
+        )
+        for job in ibm_jobs
+    ]
+    aws_tasks = [
+        asyncio.create_task(
+            wait_done(
+                task.state,
+                done_states=frozenset({"COMPLETED"}),
+                failed_states=frozenset({"FAILED", "CANCELLED"}),
+                cancel=task.cancel,
+            )
+        )
+        for task in aws_batch.tasks
+    ]
+    await asyncio.gather(*ibm_tasks, *aws_tasks)
+
+    for ghz, circ, job in zip(benchmarks, qiskit_circuits, ibm_jobs):
+        # SamplerV2 names each result field after the circuit's classical
+        # register, so look it up rather than assuming a fixed name
+        register_data = getattr(job.result()[0].data, circ.cregs[0].name)
+        counts = collections.Counter(register_data.get_counts())
+        print(f"IBM score (n={ghz.n}):", ghz.score(counts))
+    for ghz, task in zip(benchmarks, aws_batch.tasks):
+        counts = collections.Counter(task.result().measurement_counts)
+        print(f"AWS score (n={ghz.n}):", ghz.score(counts))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,7 +1,22 @@
 import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
-from sklearn.linear_model import LinearRegression
+import pandas as pd
+
+
+def _linear_fit(x, y):
+    """Closed-form least-squares line fit for a scalar feature.
+
+    Returns the predicted values and the R^2 coefficient; equivalent to
+    sklearn's LinearRegression for one feature without the estimator
+    overhead.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    slope, intercept = np.polyfit(x, y, 1)
+    y_pred = slope * x + intercept
+    r2 = 1 - ((y - y_pred) ** 2).sum() / ((y - y.mean()) ** 2).sum()
+    return y_pred, r2
 
 
 def heatmap(data, row_labels, col_labels, ax=None,
@@ -39,9 +54,16 @@ def heatmap(data, row_labels, col_labels, ax=None,
     cbar.ax.set_ylabel(cbarlabel, rotation=-90, va="bottom", fontsize=12)
     cbar.ax.tick_params(labelsize=10)
 
+    # Compute the tick grids once: majors at the cell centers, minors at the
+    # cell boundaries for the white separator grid below
+    cols = np.arange(data.shape[1])
+    rows = np.arange(data.shape[0])
+    minor_cols = np.append(cols, data.shape[1]) - 0.5
+    minor_rows = np.append(rows, data.shape[0]) - 0.5
+
     # We want to show all ticks...
-    ax.set_xticks(np.arange(data.shape[1]))
-    ax.set_yticks(np.arange(data.shape[0]))
+    ax.set_xticks(cols)
+    ax.set_yticks(rows)
     # ... and label them with the respective list entries.
     ax.set_xticklabels(col_labels, fontsize=8) # regular fontsize is 12
     ax.set_yticklabels(row_labels, fontsize=8)
@@ -55,10 +77,11 @@ def heatmap(data, row_labels, col_labels, ax=None,
              rotation_mode="anchor")
 
     # Turn spines off and create white grid.
-    ax.spines[:].set_visible(False)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
 
-    ax.set_xticks(np.arange(data.shape[1]+1)-.5, minor=True)
-    ax.set_yticks(np.arange(data.shape[0]+1)-.5, minor=True)
+    ax.set_xticks(minor_cols, minor=True)
+    ax.set_yticks(minor_rows, minor=True)
     ax.grid(which="minor", color="w", linestyle='-', linewidth=3)
     ax.tick_params(which="minor", bottom=False, left=False)
     
@@ -117,13 +140,16 @@ def annotate_heatmap(im, data=None, valfmt="{x:.2f}",
     if isinstance(valfmt, str):
         valfmt = matplotlib.ticker.StrMethodFormatter(valfmt)
 
+    # Normalize the whole array at once and pick each cell's text color with
+    # a single vectorized comparison, rather than calling im.norm per cell.
+    normed = np.asarray(im.norm(data))
+    color_mat = np.where(normed > threshold, textcolors[1], textcolors[0])
+
     # Loop over the data and create a `Text` for each "pixel".
-    # Change the text's color depending on the data.
     texts = []
     for i in range(data.shape[0]):
         for j in range(data.shape[1]):
-            kw.update(color=textcolors[int(im.norm(data[i, j]) > threshold)])
-            text = im.axes.text(j, i, valfmt(data[i, j], None), **kw)
+            text = im.axes.text(j, i, valfmt(data[i, j], None), color=color_mat[i, j], **kw)
             texts.append(text)
 
     return texts
@@ -135,49 +161,41 @@ def regression_plot(device, feature, feature_df, score_df):
     application_features = feature_df.loc[:, feature]
     scores = score_df.loc[device, :]
 
-    x, y, stddevs = [], [], []
-    ec_benchmarks = []
-    for benchmark in scores.index:
-        if isinstance(scores.loc[benchmark], tuple):
-            if 'code' in benchmark:
-                ec_benchmarks.append(
-                    (
-                    application_features.loc[benchmark],
-                    scores.loc[benchmark][0],
-                    scores.loc[benchmark][1]
-                    )
-                )
-                continue
-            x.append(application_features.loc[benchmark])
-            y.append(scores.loc[benchmark][0])
-            stddevs.append(scores.loc[benchmark][1])
+    # Split the (mean, std) score tuples into columns and separate out the
+    # error-correction benchmarks with boolean masks instead of a Python loop
+    has_score = scores.apply(lambda s: isinstance(s, tuple))
+    is_ec = scores.index.str.contains('code')
+    score_cols = scores[has_score].apply(pd.Series)
+
+    main_benchmarks = scores.index[has_score & ~is_ec]
+    ec_benchmarks = scores.index[has_score & is_ec]
 
+    x = application_features.loc[main_benchmarks].to_numpy()
+    y = score_cols.loc[main_benchmarks, 0].to_numpy()
+    stddevs = score_cols.loc[main_benchmarks, 1].to_numpy()
+
+    ec_x = application_features.loc[ec_benchmarks].to_numpy()
+    ec_y = score_cols.loc[ec_benchmarks, 0].to_numpy()
+    ec_stddevs = score_cols.loc[ec_benchmarks, 1].to_numpy()
 
     fig, ax = plt.subplots(dpi=150)
-    
+
     # Regression excluding error-correction benchmarks
-    X = np.array(x)[:, np.newaxis]
-    Y = np.array(y)
-    
-    model = LinearRegression().fit(X, Y)
-    correlation_without = model.score(X, Y)
+    y_pred, correlation_without = _linear_fit(x, y)
+
+    ax.errorbar(x, y, yerr=stddevs, marker='o', linestyle='none', color='grey', ms=4, elinewidth=1, capsize=4)
+    ax.plot(x, y_pred, color='tab:orange', ls='-', label=r'w/o EC ($R^2={:.3f}$)'.format(correlation_without))
 
-    ax.errorbar(X, Y, yerr=stddevs, marker='o', linestyle='none', color='grey', ms=4, elinewidth=1, capsize=4)
-    ax.plot(X, model.predict(X), color='tab:orange', ls='-', label=r'w/o EC ($R^2={:.3f}$)'.format(correlation_without))
-    
     # Regression including error-correction benchmarks
-    x_extended = x + [p[0] for p in ec_benchmarks]
-    y_extended = y + [p[1] for p in ec_benchmarks]
-    X = np.array(x_extended)[:, np.newaxis]
-    Y = np.array(y_extended)
-    
-    model = LinearRegression().fit(X, Y)
-    correlation_with = model.score(X, Y)
-    
-    ax.errorbar([p[0] for p in ec_benchmarks], [p[1] for p in ec_benchmarks],
-                yerr=[p[2] for p in ec_benchmarks], marker='x', linestyle='none',
+    x_extended = np.concatenate([x, ec_x])
+    y_extended = np.concatenate([y, ec_y])
+
+    y_pred, correlation_with = _linear_fit(x_extended, y_extended)
+
+    ax.errorbar(ec_x, ec_y,
+                yerr=ec_stddevs, marker='x', linestyle='none',
                 color='tab:blue', ms=6, elinewidth=1, capsize=4, label='EC Benchmarks')
-    ax.plot(X, model.predict(X), color='tab:blue', ls='-', label=r'w/ EC ($R^2={:.3f}$)'.format(correlation_with))
+    ax.plot(x_extended, y_pred, color='tab:blue', ls='-', label=r'w/ EC ($R^2={:.3f}$)'.format(correlation_with))
     
     ax.set_ylabel('Benchmark Score', fontsize=16)
     ax.set_xlabel(f'{feature} feature', fontsize=16)
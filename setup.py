@@ -1,21 +1,23 @@
-import io
+import re
 from setuptools import find_packages, setup
 
 # This reads the __version__ variable from supermarq/_version.py
-__version__ = ""
-exec(open("supermarq/_version.py").read())
+with open("supermarq/_version.py") as version_file:
+    __version__ = re.search(
+        r"""__version__\s*=\s*["'](.+?)["']""", version_file.read()
+    ).group(1)
 
 name = "SupermarQ"
 
 description = "SupermarQ is a scalable, application-centric quantum benchmarking suite."
 
 # README file as long_description.
-long_description = io.open("README.md", encoding="utf-8").read()
-
+with open("README.md", encoding="utf-8") as readme_file:
+    long_description = readme_file.read()
 
 # Read in requirements
-requirements = open("requirements.txt").readlines()
-requirements = [r.strip() for r in requirements]
+with open("requirements.txt") as requirements_file:
+    requirements = [line.strip() for line in requirements_file if line.strip()]
 
 supermarq_packages = ["supermarq"] + [
     "supermarq." + package for package in find_packages(where="supermarq")
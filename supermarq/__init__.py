@@ -1,13 +1,5 @@
-from .benchmarks import benchmark
-from .benchmarks import bit_code
-from . import features
-from .benchmarks import ghz
-from .benchmarks import hamiltonian_simulation
-from .benchmarks import mermin_bell
-from .benchmarks import phase_code
-from .benchmarks import qaoa_fermionic_swap_proxy
-from .benchmarks import qaoa_vanilla_proxy
-from .benchmarks import vqe_proxy
+import importlib
+from typing import Any
 
 __all__ = [
     "benchmark",
@@ -21,3 +13,20 @@ __all__ = [
     "qaoa_vanilla_proxy",
     "vqe_proxy",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import submodules on first attribute access (PEP 562).
+
+    Each benchmark pulls in heavyweight dependencies (cirq, qiskit, ...) on
+    import, so deferring the imports keeps `import supermarq` fast for users
+    who only need a single benchmark.
+    """
+    if name == "features":
+        module = importlib.import_module(".features", __name__)
+    elif name in __all__:
+        module = importlib.import_module(f".benchmarks.{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = module
+    return module
@@ -1,7 +1,8 @@
 import collections
+import math
+from typing import Optional
 
 import cirq
-from qiskit.quantum_info import hellinger_fidelity
 from supermarq.benchmarks.benchmark import Benchmark
 
 
@@ -15,16 +16,27 @@ class GHZ(Benchmark):
 
     def __init__(self, n: int) -> None:
         self.n = n
+        self._circuit: Optional[cirq.Circuit] = None
+        # The two bitstrings with nonzero ideal probability, precomputed so
+        # repeated score() calls don't rebuild them
+        self._all_zero = "0" * n
+        self._all_one = "1" * n
 
     def circuit(self) -> cirq.Circuit:
-        """Generate an n-qubit GHZ circuit"""
-        qubits = cirq.LineQubit.range(self.n)
-        circuit = cirq.Circuit()
-        circuit.append(cirq.H(qubits[0]))
-        for i in range(self.n - 1):
-            circuit.append(cirq.CNOT(qubits[i], qubits[i + 1]))
-        circuit.append(cirq.measure(*qubits))
-        return circuit
+        """Generate an n-qubit GHZ circuit.
+
+        The circuit depends only on `n`, so it is constructed once and
+        memoized; callers share the same instance.
+        """
+        if self._circuit is None:
+            qubits = cirq.LineQubit.range(self.n)
+            ops = (
+                [cirq.H(qubits[0])]
+                + [cirq.CNOT(qubits[i], qubits[i + 1]) for i in range(self.n - 1)]
+                + [cirq.measure(*qubits)]
+            )
+            self._circuit = cirq.Circuit(ops)
+        return self._circuit
 
     def score(self, counts: collections.Counter) -> float:
         r"""Compute the Hellinger fidelity between the experimental and ideal
@@ -32,10 +44,11 @@ class GHZ(Benchmark):
         probability of measuring the all-one state.
 
         The formula for the Hellinger fidelity between two distributions p and q
-        is given by $(\sum_i{p_i q_i})^2$.
+        is given by $(\sum_i{p_i q_i})^2$. Since the ideal distribution assigns
+        nonzero probability to only the all-0 and all-1 states, the fidelity
+        reduces to a closed form requiring just those two lookups.
         """
-        # Create an equal weighted distribution between the all-0 and all-1 states
-        ideal_dist = {b * self.n: 0.5 for b in ["0", "1"]}
         total_shots = sum(counts.values())
-        device_dist = {bitstr: count / total_shots for bitstr, count in counts.items()}
-        return hellinger_fidelity(ideal_dist, device_dist)
+        p0 = counts.get(self._all_zero, 0) / total_shots
+        p1 = counts.get(self._all_one, 0) / total_shots
+        return (math.sqrt(0.5 * p0) + math.sqrt(0.5 * p1)) ** 2
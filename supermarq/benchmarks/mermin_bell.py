@@ -1,12 +1,32 @@
 import collections
+import functools
+import itertools
 from typing import List, Tuple
 
 import cirq
 import numpy as np
-import sympy
 from supermarq.benchmarks.benchmark import Benchmark
 
 
+@functools.lru_cache(maxsize=None)
+def _mermin_operator(n: int) -> List[Tuple[float, str]]:
+    """
+    Generate the Mermin operator (https://journals.aps.org/prl/pdf/10.1103/PhysRevLett.65.1838),
+    or M_n (Eq. 2.8) in https://arxiv.org/pdf/2005.11271.pdf
+
+    M_n is the imaginary part of prod_j(x_j + i*y_j), so its terms are exactly
+    the Pauli strings with an odd number of Y's, with sign (-1)^((|Y|-1)/2).
+    """
+    mermin_op = []
+    for num_y in range(1, n + 1, 2):
+        sign = (-1) ** ((num_y - 1) // 2)
+        for y_positions in itertools.combinations(range(n), num_y):
+            pauli = "".join("Y" if i in y_positions else "X" for i in range(n))
+            mermin_op.append((float(sign), pauli))
+
+    return mermin_op
+
+
 class MerminBell(Benchmark):
     """The Mermin-Bell benchmark is a test of a quantum computer's ability
     to exploit purely quantum phenomemna such as superposition and entanglement.
@@ -83,71 +103,33 @@ class MerminBell(Benchmark):
         else:
             return self._mermin_score_N4(counts)
 
-    def _mermin_operator(self, n: int) -> List[Tuple[float, str]]:
-        """
-        Generate the Mermin operator (https://journals.aps.org/prl/pdf/10.1103/PhysRevLett.65.1838),
-        or M_n (Eq. 2.8) in https://arxiv.org/pdf/2005.11271.pdf
-        """
-        x = sympy.symbols("x_1:{}".format(n + 1))
-        y = sympy.symbols("y_1:{}".format(n + 1))
-
-        term1 = 1
-        term2 = 1
-        for j in range(n):
-            term1 = term1 * (x[j] + sympy.I * y[j])
-            term2 = term2 * (x[j] - sympy.I * y[j])
-        term1 = sympy.expand(term1)
-        term2 = sympy.expand(term2)
-
-        M_n = (1 / (2 * sympy.I)) * (term1 - term2)
-        M_n = sympy.simplify(M_n)
-
-        variables = M_n.as_terms()[1]
-        mermin_op = []
-        for term in M_n.as_terms()[0]:
-            coef = term[1][0][0]
-            pauli = [""] * n
-            for i, v in enumerate(term[1][1]):
-                if v == 1:
-                    char, idx = str(variables[i]).split("_")
-                    pauli[int(idx) - 1] = char.upper()
-
-            mermin_op.append((coef, "".join(pauli)))
-
-        return mermin_op
-
     def _mermin_score_N3(self, counts: collections.Counter) -> float:
         """
         Compute the score for the 3-qubit Mermin-Bell benchmark.
 
         This function assumes the regular big endian ordering of bitstring results
         """
-        mermin_op = self._mermin_operator(3)
+        mermin_op = _mermin_operator(3)
         count_dict = {
-            "XXY": {"counts": counts, "qubits": [0], "coef": 1},
-            "XYX": {"counts": counts, "qubits": [1], "coef": 1},
-            "YXX": {"counts": counts, "qubits": [2], "coef": -1},
-            "YYY": {"counts": counts, "qubits": [0, 1, 2], "coef": 1},
+            "XXY": {"qubits": [0], "coef": 1},
+            "XYX": {"qubits": [1], "coef": 1},
+            "YXX": {"qubits": [2], "coef": -1},
+            "YYY": {"qubits": [0, 1, 2], "coef": 1},
         }
 
-        expect_val = 0.0
-        for term in mermin_op:
-            coef, pauli = term
+        # Unpack the histogram once into a bit matrix and a vector of counts
+        # (qubit order is big endian) so each term reduces to a vector op
+        bits = np.array([[int(b) for b in bitstr] for bitstr in counts], dtype=np.int8)
+        vals = np.fromiter(counts.values(), dtype=np.float64)
+        total_counts = vals.sum()
 
-            cur_counts = count_dict[pauli]["counts"]
+        expect_val = 0.0
+        for coef, pauli in mermin_op:
             meas_qb = count_dict[pauli]["qubits"]
             meas_coef = count_dict[pauli]["coef"]
 
-            numerator = 0
-            for bitstr, count in cur_counts.items():
-                parity = meas_coef * 1
-                for qb in meas_qb:
-                    if bitstr[qb] == "1":  # Qubit order is big endian
-                        parity = -1 * parity
-
-                numerator += coef * parity * count
-
-            expect_val += numerator / sum(list(cur_counts.values()))
+            parity = 1 - 2 * (bits[:, meas_qb].sum(axis=1) & 1)
+            expect_val += coef * meas_coef * (parity * vals).sum() / total_counts
 
         #print("<mermin_op> =", expect_val)
         # so expect_val of 4 gives score of 1.0 and expect_val of -4 gives score of 0
@@ -159,36 +141,31 @@ class MerminBell(Benchmark):
 
         This function assumes the regular big endian ordering of bitstring results
         """
-        mermin_op = self._mermin_operator(4)
+        mermin_op = _mermin_operator(4)
         count_dict = {
-            "XXXY": {"counts": counts, "qubits": [0], "coef": 1},
-            "XXYX": {"counts": counts, "qubits": [1], "coef": 1},
-            "XYXX": {"counts": counts, "qubits": [2], "coef": 1},
-            "YXXX": {"counts": counts, "qubits": [3], "coef": -1},
-            "XYYY": {"counts": counts, "qubits": [0, 1, 2], "coef": -1},
-            "YXYY": {"counts": counts, "qubits": [0, 1, 3], "coef": 1},
-            "YYXY": {"counts": counts, "qubits": [0, 2, 3], "coef": 1},
-            "YYYX": {"counts": counts, "qubits": [1, 2, 3], "coef": 1},
+            "XXXY": {"qubits": [0], "coef": 1},
+            "XXYX": {"qubits": [1], "coef": 1},
+            "XYXX": {"qubits": [2], "coef": 1},
+            "YXXX": {"qubits": [3], "coef": -1},
+            "XYYY": {"qubits": [0, 1, 2], "coef": -1},
+            "YXYY": {"qubits": [0, 1, 3], "coef": 1},
+            "YYXY": {"qubits": [0, 2, 3], "coef": 1},
+            "YYYX": {"qubits": [1, 2, 3], "coef": 1},
         }
 
-        expect_val = 0.0
-        for term in mermin_op:
-            coef, pauli = term
+        # Unpack the histogram once into a bit matrix and a vector of counts
+        # (qubit order is big endian) so each term reduces to a vector op
+        bits = np.array([[int(b) for b in bitstr] for bitstr in counts], dtype=np.int8)
+        vals = np.fromiter(counts.values(), dtype=np.float64)
+        total_counts = vals.sum()
 
-            cur_counts = count_dict[pauli]["counts"]
+        expect_val = 0.0
+        for coef, pauli in mermin_op:
             meas_qb = count_dict[pauli]["qubits"]
             meas_coef = count_dict[pauli]["coef"]
 
-            numerator = 0
-            for bitstr, count in cur_counts.items():
-                parity = meas_coef * 1
-                for qb in meas_qb:
-                    if bitstr[qb] == "1":  # Qubit order is big endian
-                        parity = -1 * parity
-
-                numerator += coef * parity * count
-
-            expect_val += numerator / sum(list(cur_counts.values()))
+            parity = 1 - 2 * (bits[:, meas_qb].sum(axis=1) & 1)
+            expect_val += coef * meas_coef * (parity * vals).sum() / total_counts
 
         #print("<mermin_op> =", expect_val)
         # so expect_val of 8 gives score of 1.0 and expect_val of -8 gives score of 0
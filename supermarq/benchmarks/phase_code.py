@@ -1,7 +1,9 @@
 import collections
-from typing import Dict, List
+import functools
+from typing import Dict, List, Optional, Tuple
 
 import cirq
+import numpy as np
 from qiskit.quantum_info import hellinger_fidelity
 from supermarq.benchmarks.benchmark import Benchmark
 
@@ -22,13 +24,18 @@ class PhaseCode(Benchmark):
     """
 
     def __init__(
-        self, num_data_qubits: int, num_rounds: int, phase_state: List[int] = [0, 1, 0]
+        self, num_data_qubits: int, num_rounds: int, phase_state: Optional[List[int]] = None
     ) -> None:
+        # A literal list default would be shared (and mutable) across every
+        # instance; default to the all-+ state of the right length instead
+        if phase_state is None:
+            phase_state = [0] * num_data_qubits
         if len(phase_state) != num_data_qubits:
             raise ValueError("The length of `phase_state` must match the number of data qubits")
         self.num_data_qubits = num_data_qubits
         self.num_rounds = num_rounds
-        self.phase_state = phase_state
+        self.phase_state: Tuple[int, ...] = tuple(phase_state)
+        self._circuit: Optional[cirq.Circuit] = None
 
     def _measurement_round_cirq(self, qubits: List[cirq.LineQubit], round_num: int) -> None:
         """
@@ -38,15 +45,32 @@ class PhaseCode(Benchmark):
         - qubits: Circuit qubits - assumed data on even indices and
                   measurement on odd indices
         """
-        yield [cirq.H(q) for q in qubits]
+        # H·H = I on the data qubits between adjacent rounds (nothing touches
+        # them in between), so the leading Hadamard layer only needs the data
+        # qubits on the first round and the trailing layer on the last round
+        if round_num == 0:
+            yield [cirq.H(q) for q in qubits]
+        else:
+            yield [cirq.H(qubits[i]) for i in range(1, len(qubits), 2)]
         for i in range(1, len(qubits), 2):
             yield cirq.CZ(qubits[i - 1], qubits[i])
             yield cirq.CZ(qubits[i + 1], qubits[i])
-        yield [cirq.H(q) for q in qubits]
+        if round_num == self.num_rounds - 1:
+            yield [cirq.H(q) for q in qubits]
+        else:
+            yield [cirq.H(qubits[i]) for i in range(1, len(qubits), 2)]
         yield [cirq.measure(qubits[i], key=f'mcm{i}_{round_num}') for i in range(1, len(qubits), 2)]
         yield [cirq.ops.reset(qubits[i]) for i in range(1, len(qubits), 2)]
 
     def circuit(self) -> cirq.Circuit:
+        """Generate the phase code circuit.
+
+        The circuit depends only on the parameters fixed at construction, so
+        it is built once and memoized.
+        """
+        if self._circuit is not None:
+            return self._circuit
+
         num_qubits = 2 * self.num_data_qubits - 1
         qubits = cirq.LineQubit.range(num_qubits)
         circuit = cirq.Circuit()
@@ -62,11 +86,16 @@ class PhaseCode(Benchmark):
 
         circuit.append(cirq.measure(*qubits))
 
+        self._circuit = circuit
         return circuit
 
     def _get_dist(self, circuit: cirq.Circuit) -> collections.Counter:
         shots = 5000
-        result = cirq.Simulator().run(circuit, repetitions=shots)
+        # The phase code only uses Clifford gates (H, CZ, X, reset, measure),
+        # so stabilizer simulation samples in polynomial rather than
+        # exponential time. The fixed seed keeps the reference distribution
+        # reproducible between score() calls.
+        result = cirq.CliffordSimulator(seed=0).run(circuit, repetitions=shots)
 
         num_measured_qubits = []
         for _, op in circuit.findall_operations(cirq.is_measurement):
@@ -75,22 +104,33 @@ class PhaseCode(Benchmark):
 
         # cirq.Result.multi_measurement_histogram returns a collection.Counter object
         # where the keys are tuples of integers and the values are the shot counts.
-        # The integers in the keys indicate the bitstring result of each set of measurement tags.
-        counts: Dict[str, int] = collections.defaultdict(int)
-        for key, val in raw_counts.items():
-            bit_list = []
-            for int_tag, num_bits in zip(key, num_measured_qubits):
-                bit_list.extend(cirq.value.big_endian_int_to_bits(int_tag, bit_count=num_bits))
-            counts["".join([str(b) for b in bit_list])] = val / shots
+        # The integers in the keys indicate the bitstring result of each set of measurement
+        # tags. Unpack every tag column into its bits at once rather than calling
+        # cirq.value.big_endian_int_to_bits per key.
+        keys = np.array(list(raw_counts.keys()), dtype=np.uint64)
+        vals = np.fromiter(raw_counts.values(), dtype=np.float64) / shots
+        bit_matrix = np.hstack(
+            [
+                (keys[:, col, None] >> np.arange(num_bits - 1, -1, -1, dtype=np.uint64)) & 1
+                for col, num_bits in enumerate(num_measured_qubits)
+            ]
+        )
+        chars = np.where(bit_matrix, "1", "0")
+        counts: Dict[str, float] = {"".join(row): val for row, val in zip(chars, vals)}
 
         return collections.Counter(counts)
 
+    @functools.cached_property
+    def _ideal_dist(self) -> collections.Counter:
+        """Reference distribution, simulated once and reused across score() calls."""
+        return self._get_dist(self.circuit())
+
     def score(self, counts: collections.Counter) -> float:
         """Device performance is given by the Hellinger fidelity between
         the experimental results and the ideal distribution. The ideal
         is known based on the bit_state parameter.
         """
-        ideal_dist = self._get_dist(self.circuit())
+        ideal_dist = self._ideal_dist
         total_shots = sum(counts.values())
         experimental_dist = {bitstr: shots / total_shots for bitstr, shots in counts.items()}
         return hellinger_fidelity(ideal_dist, experimental_dist)
@@ -1,12 +1,42 @@
+from typing import Iterator, List
+
+import cirq
 import pytest
+from qiskit.quantum_info import hellinger_fidelity
 from supermarq.benchmarks.phase_code import PhaseCode
 
 
+def _original_measurement_round(qubits: List[cirq.LineQubit], round_num: int) -> Iterator:
+    """A measurement round with the original all-qubit Hadamard layers."""
+    yield [cirq.H(q) for q in qubits]
+    for i in range(1, len(qubits), 2):
+        yield cirq.CZ(qubits[i - 1], qubits[i])
+        yield cirq.CZ(qubits[i + 1], qubits[i])
+    yield [cirq.H(q) for q in qubits]
+    yield [cirq.measure(qubits[i], key=f'mcm{i}_{round_num}') for i in range(1, len(qubits), 2)]
+    yield [cirq.ops.reset(qubits[i]) for i in range(1, len(qubits), 2)]
+
+
 def test_phase_code_circuit() -> None:
     pc = PhaseCode(3, 1, [1, 1, 1])
     assert len(pc.circuit().all_qubits()) == 5
 
 
+def test_hadamard_cancellation() -> None:
+    # Collapsing the between-round Hadamard layers must leave the sampled
+    # distribution unchanged relative to the original circuit construction
+    pc = PhaseCode(3, 2, [0, 1, 0])
+    qubits = cirq.LineQubit.range(5)
+    original = cirq.Circuit()
+    for i in range(pc.num_data_qubits):
+        if pc.phase_state[i] == 1:
+            original.append(cirq.X(qubits[2 * i]))
+        original.append(cirq.H(qubits[2 * i]))
+    original.append(_original_measurement_round(qubits, r) for r in range(pc.num_rounds))
+    original.append(cirq.measure(*qubits))
+    assert hellinger_fidelity(pc._get_dist(original), pc._get_dist(pc.circuit())) > 0.99
+
+
 def test_phase_code_score() -> None:
     pc = PhaseCode(3, 1, [1, 1, 1])
     assert pc.score(pc._get_dist(pc.circuit())) > 0.99
@@ -7,11 +7,22 @@ from supermarq.benchmarks.qaoa_fermionic_swap_proxy import QAOAFermionicSwapProx
 def test_qaoa_circuit() -> None:
     qaoa = QAOAFermionicSwapProxy(4)
     assert len(qaoa.circuit().all_qubits()) == 4
+    # The swap network touches 6 edges: one ZZ + SWAP pair per edge
     assert (
         len(
-            list(qaoa.circuit().findall_operations(lambda op: isinstance(op.gate, type(cirq.CNOT))))
+            list(
+                qaoa.circuit().findall_operations(
+                    lambda op: isinstance(op.gate, cirq.ZZPowGate)
+                )
+            )
         )
-        == 18
+        == 6
+    )
+    assert (
+        len(
+            list(qaoa.circuit().findall_operations(lambda op: op.gate == cirq.SWAP))
+        )
+        == 6
     )
 
 
@@ -1,12 +1,35 @@
 import collections
-from typing import List, Tuple
+import functools
+from typing import List, Optional, Tuple
 
 import cirq
+import numba
 import numpy as np
 import scipy
 from supermarq.benchmarks.benchmark import Benchmark
 
 
+@functools.lru_cache(maxsize=None)
+def _bits_matrix(n: int) -> np.ndarray:
+    """Bit k of every n-bit state index, in big endian order."""
+    states = np.arange(2 ** n, dtype=np.int64)
+    return ((states[:, None] >> np.arange(n - 1, -1, -1)) & 1).astype(np.uint8)
+
+
+@numba.njit(cache=True)
+def _bitstring_energy(
+    bits: np.ndarray, edges_i: np.ndarray, edges_j: np.ndarray, weights: np.ndarray
+) -> float:
+    """Compiled kernel for the SK energy of a single decoded bitstring."""
+    H_val = 0.0
+    for k in range(edges_i.shape[0]):
+        if bits[edges_i[k]] == bits[edges_j[k]]:
+            H_val -= weights[k]  # if edge is UNCUT, weight counts against objective
+        else:
+            H_val += weights[k]  # if edge is CUT, weight counts towards objective
+    return H_val
+
+
 class QAOAVanillaProxy(Benchmark):
     """Proxy of a full Quantum Approximate Optimization Algorithm
     (QAOA) benchmark. The benchmark targets MaxCut on a Sherrington-Kirkpatrick model.
@@ -15,33 +38,32 @@ class QAOAVanillaProxy(Benchmark):
     simulation.
     """
 
-    def __init__(self, num_qubits: int) -> None:
+    def __init__(self, num_qubits: int, random_seed: Optional[int] = None) -> None:
         self.num_qubits = num_qubits
+        self._rng = np.random.default_rng(random_seed)
         # Intialize the benchmark parameters
         #   1. Generate a random instance of an SK graph
         #   2. Find approximately optimal angles (rather than random values)
-        self.Hamiltonian = self._gen_sk_Hamiltonian()
+        self._I, self._J, self._W = self._gen_sk_Hamiltonian()
+        # The energy of each basis state depends only on the Hamiltonian, not
+        # on (gamma, beta), so compute it once rather than per COBYLA step
+        self._E_per_state = self._precompute_energies()
         #self.params = self._gen_angles()
         self.params = [1, 1]
+        self._circuit: Optional[cirq.Circuit] = None
 
-    def _gen_sk_Hamiltonian(self) -> List:
-        """randomly pick +1 or -1 for each edge weight"""
-        random_weights = list(
-            2
-            * np.random.randint(
-                low=0, high=1 + 1, size=int(self.num_qubits * (self.num_qubits - 1) / 2)
-            )
-            - 1
-        )
-
-        H = []
-        for i in range(self.num_qubits):
-            for j in range(i + 1, self.num_qubits):
-                H.append([i, j, random_weights.pop()])
-
-        np.random.shuffle(H)
+    @property
+    def Hamiltonian(self) -> List:
+        """The SK Hamiltonian materialized as a list of [i, j, weight] edges."""
+        return [[int(i), int(j), int(w)] for i, j, w in zip(self._I, self._J, self._W)]
 
-        return H
+    def _gen_sk_Hamiltonian(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """randomly pick +1 or -1 for each edge weight"""
+        edges_i, edges_j = np.triu_indices(self.num_qubits, k=1)
+        weights = self._rng.choice(np.array([-1, 1], dtype=np.int8), size=edges_i.size)
+        # Shuffle the edge order, matching the old list-based construction
+        perm = self._rng.permutation(edges_i.size)
+        return edges_i[perm], edges_j[perm], weights[perm]
 
     def _gen_ansatz(self, gamma: float, beta: float) -> cirq.Circuit:
         qubits = cirq.LineQubit.range(self.num_qubits)
@@ -52,8 +74,7 @@ class QAOAVanillaProxy(Benchmark):
             circuit.append(cirq.H(qubits[i]))
 
         # Apply the phase separator unitary
-        for term in self.Hamiltonian:
-            i, j, weight = term
+        for i, j, weight in zip(self._I, self._J, self._W):
             phi = gamma * weight
 
             # Perform a ZZ interaction
@@ -71,19 +92,58 @@ class QAOAVanillaProxy(Benchmark):
         return circuit
 
     def _get_energy_for_bitstring(self, bitstring: str) -> float:
-        H_val = 0
-        for i, j, weight in self.Hamiltonian:
-            if bitstring[i] == bitstring[j]:
-                H_val -= weight  # if edge is UNCUT, weight counts against objective
-            else:
-                H_val += weight  # if edge is CUT, weight counts towards objective
-        return H_val
-
-    def _get_expected_H_from_probs(self, probabilities: collections.Counter) -> float:
-        H_expectation = 0.0
-        for bitstring, probability in probabilities.items():
-            H_expectation += probability * self._get_energy_for_bitstring(bitstring)
-        return H_expectation
+        bits = np.frombuffer(bitstring.encode(), dtype=np.uint8) - ord("0")
+        return _bitstring_energy(bits, self._I, self._J, self._W)
+
+    def _get_expected_H_from_probs(self, counts: collections.Counter) -> float:
+        """Expected SK energy of a counts (or probability) distribution.
+
+        All bitstring keys are decoded into one bit matrix and the expectation
+        is formed as a single dot product; the weights are normalized
+        internally, so raw shot counts work as well as probabilities.
+        """
+        bits = (np.frombuffer("".join(counts).encode(), dtype=np.uint8) - ord("0")).reshape(
+            len(counts), self.num_qubits
+        )
+        weights = np.fromiter(counts.values(), dtype=np.float64)
+        cuts = bits[:, self._I] != bits[:, self._J]
+        energies = 2 * (cuts @ self._W) - self._W.sum()
+        return float(weights @ energies) / weights.sum()
+
+    def _expected_energy_from_statevector(self, statevector: np.ndarray) -> float:
+        """Compute the expected SK energy over all 2^n amplitudes at once.
+
+        The per-state energies and measurement probabilities are formed as
+        whole vectors, so the expectation reduces to a single dot product.
+        """
+        probs = np.abs(statevector) ** 2
+        return float(probs @ self._E_per_state)
+
+    def _simulate_ideal(self, gamma: float, beta: float) -> np.ndarray:
+        """Compute the ideal statevector of the p=1 ansatz directly with NumPy.
+
+        The circuit is |+>^n followed by a diagonal phase separator and a
+        uniform rx(2*beta) mixing layer, so the state is an elementwise phase
+        (exp(i*gamma*E) per basis state, up to global phase) followed by a
+        2x2 rotation per qubit axis — no general-purpose simulator needed.
+        """
+        n = self.num_qubits
+        psi = np.full(2 ** n, 2 ** (-n / 2), dtype=np.complex128)
+        psi *= np.exp(1j * gamma * self._E_per_state)
+        cos_b = np.cos(beta)
+        isin_b = -1j * np.sin(beta)
+        psi = psi.reshape((2,) * n)
+        for axis in range(n):
+            lo = psi.take(0, axis=axis)
+            hi = psi.take(1, axis=axis)
+            psi = np.stack([cos_b * lo + isin_b * hi, isin_b * lo + cos_b * hi], axis=axis)
+        return psi.reshape(-1)
+
+    def _precompute_energies(self) -> np.ndarray:
+        """Build the vector of SK energies for every n-bit basis state."""
+        bit_matrix = _bits_matrix(self.num_qubits)
+        cuts = bit_matrix[:, self._I] != bit_matrix[:, self._J]
+        return 2 * (cuts @ self._W) - self._W.sum()
 
     def _get_ideal_counts(self, circuit: cirq.Circuit) -> collections.Counter:
         n = len(circuit.all_qubits())
@@ -97,21 +157,21 @@ class QAOAVanillaProxy(Benchmark):
     def _get_opt_angles(self) -> Tuple[List, float]:
         def f(params: List) -> float:
             gamma, beta = params
-            circ = self._gen_ansatz(gamma, beta)
-            probs = self._get_ideal_counts(circ)
-            H_expect = self._get_expected_H_from_probs(probs)
+            H_expect = self._expected_energy_from_statevector(self._simulate_ideal(gamma, beta))
 
             return -H_expect  # because we are minimizing instead of maximizing
 
         init_params = [np.random.uniform() * 2 * np.pi, np.random.uniform() * 2 * np.pi]
-        out = scipy.optimize.minimize(f, init_params, method="COBYLA")
+        # The objective is smooth and cheap to evaluate, so a quasi-Newton
+        # method converges in fewer evaluations than derivative-free COBYLA
+        out = scipy.optimize.minimize(f, init_params, method="L-BFGS-B")
 
         return out["x"], out["fun"]
 
     def _gen_angles(self) -> List:
         # Classically simulate the variational optimization 5 times,
         # return the parameters from the best performing simulation
-        best_params, best_cost = [], 0.0
+        best_params, best_cost = [], np.inf
         for _ in range(5):
             params, cost = self._get_opt_angles()
             if cost < best_cost:
@@ -124,9 +184,19 @@ class QAOAVanillaProxy(Benchmark):
         the generic ansatz structure given by the form of the Hamiltonian.
         We restrict the depth of this proxy benchmark to p=1 to keep the
         classical simulation scalable.
+
+        The circuit depends only on the parameters fixed at construction, so
+        it is built once and memoized.
         """
-        gamma, beta = self.params
-        return self._gen_ansatz(gamma, beta)
+        if self._circuit is None:
+            gamma, beta = self.params
+            self._circuit = self._gen_ansatz(gamma, beta)
+        return self._circuit
+
+    @functools.cached_property
+    def _H_ideal(self) -> float:
+        """Noiseless expectation value, simulated once and reused across score() calls."""
+        return self._get_expected_H_from_probs(self._get_ideal_counts(self.circuit()))
 
     def score(self, counts: collections.Counter) -> float:
         """Compare the experimental output to the output of noiseless simulation.
@@ -134,11 +204,7 @@ class QAOAVanillaProxy(Benchmark):
         However, it could in principle be done efficiently via
         https://arxiv.org/abs/1706.02998, so we're good.
         """
-        ideal_counts = self._get_ideal_counts(self.circuit())
-        total_shots = sum(counts.values())
-        experimental_counts = collections.Counter({k: v / total_shots for k, v in counts.items()})
-
-        H_ideal = self._get_expected_H_from_probs(ideal_counts)
-        H_experimental = self._get_expected_H_from_probs(experimental_counts)
+        H_ideal = self._H_ideal
+        H_experimental = self._get_expected_H_from_probs(counts)
 
         return 1 - abs(H_ideal - H_experimental) / (2 * H_ideal)
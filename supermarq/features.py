@@ -1,6 +1,7 @@
+import multiprocessing
+
 import cirq
 import matplotlib.pyplot as plt
-import networkx as nx
 import numpy as np
 import qiskit
 from matplotlib.patches import Circle, RegularPolygon
@@ -9,62 +10,167 @@ from matplotlib.projections import register_projection
 from matplotlib.projections.polar import PolarAxes
 from matplotlib.spines import Spine
 from matplotlib.transforms import Affine2D
-from typing import Union
+from typing import Callable, List, Optional, Tuple, Union, cast
 
 
-def cirq_to_qiskit(circuit: cirq.Circuit) -> qiskit.circuit.QuantumCircuit:
+def _cirq_to_qiskit_via_qasm(circuit: cirq.Circuit) -> qiskit.circuit.QuantumCircuit:
     qasm = cirq.circuits.QasmOutput(circuit, sorted(circuit.all_qubits()))
     return qiskit.circuit.QuantumCircuit().from_qasm_str(str(qasm))
 
 
-def compute_connectivity(circuit: Union[cirq.Circuit, qiskit.circuit.QuantumCircuit]) -> float:
+# A handler appends the qiskit equivalent of one cirq gate to the circuit
+_GateHandler = Callable[[cirq.Gate, qiskit.circuit.QuantumCircuit, List[int]], None]
+
+
+def _append_measurement(
+    gate: cirq.Gate, qc: qiskit.circuit.QuantumCircuit, indices: List[int]
+) -> None:
+    creg = qiskit.circuit.ClassicalRegister(len(indices), f"m{len(qc.cregs)}")
+    qc.add_register(creg)
+    qc.measure(indices, creg)
+
+
+def _append_reset(gate: cirq.Gate, qc: qiskit.circuit.QuantumCircuit, indices: List[int]) -> None:
+    qc.reset(*indices)
+
+
+def _append_rzz(gate: cirq.Gate, qc: qiskit.circuit.QuantumCircuit, indices: List[int]) -> None:
+    qc.rzz(cast(cirq.EigenGate, gate).exponent * np.pi, *indices)
+
+
+def _exact_handler(name: str) -> _GateHandler:
+    """Build a handler for gates with a fixed qiskit equivalent at exponent 1."""
+
+    def append(gate: cirq.Gate, qc: qiskit.circuit.QuantumCircuit, indices: List[int]) -> None:
+        if cast(cirq.EigenGate, gate).exponent != 1:
+            raise ValueError(f"no direct translation for {gate!r}")
+        getattr(qc, name)(*indices)
+
+    return append
+
+
+def _rotation_handler(plain: str, rotation: str) -> _GateHandler:
+    """Build a handler for a Pauli-power family.
+
+    Plain powers of the Pauli use the named gate; fractional exponents map to
+    the corresponding rotation gate, matching how cirq's QASM output lowers
+    them (equal up to global phase)."""
+
+    def append(gate: cirq.Gate, qc: qiskit.circuit.QuantumCircuit, indices: List[int]) -> None:
+        eigen = cast(cirq.EigenGate, gate)
+        if eigen.exponent == 1 and eigen.global_shift == 0:
+            getattr(qc, plain)(*indices)
+        else:
+            getattr(qc, rotation)(eigen.exponent * np.pi, *indices)
+
+    return append
+
+
+# Matched in order with isinstance, so rotation subclasses such as cirq.Rx
+# land in their Pauli-power family handler
+_GATE_HANDLERS = (
+    (cirq.MeasurementGate, _append_measurement),
+    (cirq.HPowGate, _exact_handler("h")),
+    (cirq.XPowGate, _rotation_handler("x", "rx")),
+    (cirq.YPowGate, _rotation_handler("y", "ry")),
+    (cirq.ZPowGate, _rotation_handler("z", "rz")),
+    (cirq.CXPowGate, _exact_handler("cx")),
+    (cirq.CZPowGate, _exact_handler("cz")),
+    (cirq.SwapPowGate, _exact_handler("swap")),
+    (cirq.ZZPowGate, _append_rzz),
+    (cirq.ResetChannel, _append_reset),
+)
+
+
+def _translate_op(
+    op: cirq.Operation, qc: qiskit.circuit.QuantumCircuit, indices: List[int]
+) -> None:
+    """Append the qiskit equivalent of a single cirq operation, or raise ValueError."""
+    for gate_type, handler in _GATE_HANDLERS:
+        if isinstance(op.gate, gate_type):
+            handler(op.gate, qc, indices)
+            return
+    raise ValueError(f"no direct translation for {op.gate!r}")
+
+
+def cirq_to_qiskit(circuit: cirq.Circuit) -> qiskit.circuit.QuantumCircuit:
+    """Convert a cirq circuit to qiskit.
+
+    Common gates are appended directly, avoiding the QASM serialize/parse
+    round-trip that dominates conversion time; circuits containing a gate
+    outside the translation table fall back to the QASM path. Qubits are
+    ordered as sorted(circuit.all_qubits()), matching the QASM output.
+    """
+    qubits = sorted(circuit.all_qubits())
+    index = {q: i for i, q in enumerate(qubits)}
+    qc = qiskit.circuit.QuantumCircuit(len(qubits))
+    try:
+        for op in circuit.all_operations():
+            _translate_op(op, qc, [index[q] for q in op.qubits])
+    except (ValueError, TypeError):
+        # Unknown gate (or symbolic parameter): defer to the QASM path
+        return _cirq_to_qiskit_via_qasm(circuit)
+    return qc
+
+
+def _prepare(
+    circuit: Union[cirq.Circuit, qiskit.circuit.QuantumCircuit, Tuple]
+) -> Tuple[qiskit.circuit.QuantumCircuit, qiskit.dagcircuit.DAGCircuit]:
+    """Convert to qiskit (if needed) and build the barrier-free DAG once.
+
+    Every compute_* function needs this identical pipeline; callers computing
+    several features on one circuit can call `_prepare` themselves and pass
+    the resulting (circuit, dag) pair to each feature so the conversion and
+    DAG construction run once instead of per feature.
+    """
+    if isinstance(circuit, tuple):
+        return circuit
     if isinstance(circuit, cirq.Circuit):
-        circ = cirq_to_qiskit(circuit)
-    else:
-        circ = circuit
+        circuit = cirq_to_qiskit(circuit)
+    dag = qiskit.converters.circuit_to_dag(circuit)
+    dag.remove_all_ops_named("barrier")
+    return circuit, dag
+
 
+def _qubit_indices(circ: qiskit.circuit.QuantumCircuit) -> "dict":
+    """Map each qubit to its position in the circuit's qubit list."""
+    return {qubit: i for i, qubit in enumerate(circ.qubits)}
+
+
+def compute_connectivity(circuit: Union[cirq.Circuit, qiskit.circuit.QuantumCircuit]) -> float:
+    circ, dag = _prepare(circuit)
     N = circ.num_qubits
-    dag = qiskit.converters.circuit_to_dag(circ)
-    dag.remove_all_ops_named("barrier")
+    indices = _qubit_indices(circ)
 
-    G = nx.Graph()
+    # The degree sum of a simple graph is 2|E|, so deduplicating the edges
+    # in a set replaces the graph construction and per-node degree calls
+    edges = set()
     for op in dag.two_qubit_ops():
         q1, q2 = op.qargs
-        G.add_edge(q1.index, q2.index)
+        edges.add(frozenset((indices[q1], indices[q2])))
 
-    degree_sum = sum([G.degree(n) for n in G.nodes])
-
-    return degree_sum / (N * (N - 1))
+    return 2 * len(edges) / (N * (N - 1))
 
 
 def compute_liveness(circuit: Union[cirq.Circuit, qiskit.circuit.QuantumCircuit]) -> float:
-    if isinstance(circuit, cirq.Circuit):
-        circ = cirq_to_qiskit(circuit)
-    else:
-        circ = circuit
-
+    circ, dag = _prepare(circuit)
     N = circ.num_qubits
-    dag = qiskit.converters.circuit_to_dag(circ)
-    dag.remove_all_ops_named("barrier")
-
-    activity_matrix = np.zeros((N, dag.depth()))
 
-    for i, layer in enumerate(dag.layers()):
+    # Each layer is a partition of the active qubits, so no qubit appears in
+    # two ops of one layer; counting qubits per op directly gives the number
+    # of active (qubit, layer) pairs without materializing an N x depth matrix
+    active = 0
+    depth = 0
+    for layer in dag.layers():
+        depth += 1
         for op in layer["partition"]:
-            for qubit in op:
-                activity_matrix[qubit.index, i] = 1
+            active += len(op)
 
-    return np.sum(activity_matrix) / (N * dag.depth())
+    return active / (N * depth)
 
 
 def compute_parallelism(circuit: Union[cirq.Circuit, qiskit.circuit.QuantumCircuit]) -> float:
-    if isinstance(circuit, cirq.Circuit):
-        circ = cirq_to_qiskit(circuit)
-    else:
-        circ = circuit
-
-    dag = qiskit.converters.circuit_to_dag(circ)
-    dag.remove_all_ops_named("barrier")
+    circ, dag = _prepare(circuit)
     return max(1 - (circ.depth() / len(dag.gate_nodes())), 0)
 
 
@@ -76,56 +182,34 @@ def compute_measurement(circuit: Union[cirq.Circuit, qiskit.circuit.QuantumCircu
     -----
     circ : QuantumCircuit
     """
-    if isinstance(circuit, cirq.Circuit):
-        circ = cirq_to_qiskit(circuit)
-    else:
-        circ = circuit
-
-    dag = qiskit.converters.circuit_to_dag(circ)
-    dag.remove_all_ops_named("barrier")
+    circ, dag = _prepare(circuit)
 
     reset_moments = 0
     gate_depth = dag.depth() - 1
 
     for layer in dag.layers():
-        reset_present = False
-        for op in layer['graph'].op_nodes():
-            if op.name == 'reset':
-                reset_present += True
-        if reset_present:
+        # any() stops scanning the layer at the first reset
+        if any(op.name == 'reset' for op in layer['graph'].op_nodes()):
             reset_moments += 1
 
     return reset_moments / gate_depth
 
 
 def compute_entanglement(circuit: Union[cirq.Circuit, qiskit.circuit.QuantumCircuit]) -> float:
-    if isinstance(circuit, cirq.Circuit):
-        circ = cirq_to_qiskit(circuit)
-    else:
-        circ = circuit
-
-    dag = qiskit.converters.circuit_to_dag(circ)
-    dag.remove_all_ops_named("barrier")
+    circ, dag = _prepare(circuit)
 
     return len(dag.two_qubit_ops()) / len(dag.gate_nodes())
 
 
 def compute_depth(circuit: Union[cirq.Circuit, qiskit.circuit.QuantumCircuit]) -> float:
-    if isinstance(circuit, cirq.Circuit):
-        circ = cirq_to_qiskit(circuit)
-    else:
-        circ = circuit
-
-    dag = qiskit.converters.circuit_to_dag(circ)
-    dag.remove_all_ops_named("barrier")
-    n_ed = 0
-    two_q_gates = set([op.name for op in dag.two_qubit_ops()])
-    for name in two_q_gates:
-        try:
-            n_ed += dag.count_ops_longest_path()[name]
-        except KeyError:
-            continue
-    n_e = len(dag.two_qubit_ops())
+    circ, dag = _prepare(circuit)
+    # Collect the two-qubit ops and the longest path once; the old per-name
+    # loop recomputed the longest path for every distinct gate name
+    two_q_ops = dag.two_qubit_ops()
+    two_q_gates = set([op.name for op in two_q_ops])
+    longest_path_ops = dag.count_ops_longest_path()
+    n_ed = sum(longest_path_ops.get(name, 0) for name in two_q_gates)
+    n_e = len(two_q_ops)
 
     if n_ed == 0:
         return 0
@@ -133,6 +217,76 @@ def compute_depth(circuit: Union[cirq.Circuit, qiskit.circuit.QuantumCircuit]) -
     return n_ed / n_e
 
 
+def compute_all_features(
+    circuit: Union[cirq.Circuit, qiskit.circuit.QuantumCircuit]
+) -> "dict[str, float]":
+    """Compute every feature with a single traversal of the circuit's DAG.
+
+    Returns a dict keyed by feature name. The values match the individual
+    compute_* functions, but the layer structure, gate counts, and two-qubit
+    ops are collected in one pass instead of once per feature.
+    """
+    circ, dag = _prepare(circuit)
+    N = circ.num_qubits
+
+    depth = 0
+    active = 0
+    num_gate_nodes = 0
+    reset_moments = 0
+    two_q_ops = []
+    for layer in dag.layers():
+        depth += 1
+        for op in layer["partition"]:
+            active += len(op)
+        reset_present = False
+        for node in layer["graph"].op_nodes():
+            if node.name == "reset":
+                reset_present = True
+            if isinstance(node.op, qiskit.circuit.Gate):
+                num_gate_nodes += 1
+            if len(node.qargs) == 2:
+                two_q_ops.append(node)
+        if reset_present:
+            reset_moments += 1
+
+    indices = _qubit_indices(circ)
+    edges = set()
+    for node in two_q_ops:
+        q1, q2 = node.qargs
+        edges.add(frozenset((indices[q1], indices[q2])))
+    degree_sum = 2 * len(edges)
+
+    two_q_gates = set([node.name for node in two_q_ops])
+    longest_path_ops = dag.count_ops_longest_path()
+    n_ed = sum(longest_path_ops.get(name, 0) for name in two_q_gates)
+
+    return {
+        "connectivity": degree_sum / (N * (N - 1)),
+        "liveness": active / (N * depth),
+        "parallelism": max(1 - (circ.depth() / num_gate_nodes), 0),
+        "measurement": reset_moments / (depth - 1),
+        "entanglement": len(two_q_ops) / num_gate_nodes,
+        "depth": n_ed / len(two_q_ops) if n_ed else 0,
+    }
+
+
+def compute_all_features_batch(
+    circuits: List[Union[cirq.Circuit, qiskit.circuit.QuantumCircuit]],
+    processes: Optional[int] = None,
+) -> "List[dict[str, float]]":
+    """Compute feature vectors for a batch of circuits in parallel.
+
+    Each circuit's conversion and DAG traversal is independent of the others,
+    so the batch is spread over a process pool (one worker per core by
+    default). Results come back in input order; pass processes=1 to run
+    serially in the calling process.
+    """
+    if processes == 1:
+        return [compute_all_features(circuit) for circuit in circuits]
+    with multiprocessing.Pool(processes=processes) as pool:
+        return pool.map(compute_all_features, circuits)
+
+
 def radar_factory(num_vars, frame="circle"):
     """
     (https://matplotlib.org/stable/gallery/specialty_plots/radar_chart.html)